@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import curses
 
 from discord_client import DiscordHTTPClient
@@ -8,12 +9,18 @@ from settings import load_settings
 from ui import CursesApplication
 
 
-def main() -> None:
+async def async_main() -> None:
   settings = load_settings()
-  with DiscordHTTPClient(settings.discord) as client:
+  async with DiscordHTTPClient(settings.discord) as client:
     service = MudaeService(client, settings)
-    app = CursesApplication(service, settings)
-    curses.wrapper(app.run)
+    app = CursesApplication(service, settings, loop=asyncio.get_running_loop())
+    # Curses blocks on keyboard input, so the dashboard runs on a worker
+    # thread while roll sessions execute on this event loop.
+    await asyncio.to_thread(curses.wrapper, app.run)
+
+
+def main() -> None:
+  asyncio.run(async_main())
 
 
 if __name__ == '__main__':
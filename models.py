@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
@@ -13,59 +14,59 @@ class LogLevel(str, Enum):
   ERROR = 'error'
 
 
-class DiscordEmbed(BaseModel):
-  """Subset of Discord embed fields we care about."""
+# The Discord wire models below are decoded on every polling tick and only
+# consumed internally, so they are plain slotted dataclasses validated via
+# pydantic TypeAdapters rather than full BaseModel subclasses.
 
-  model_config = ConfigDict(extra='ignore')
 
-  title: str | None = Field(default=None)
-  description: str | None = Field(default=None)
-  url: str | None = Field(default=None)
+@dataclass(slots=True)
+class DiscordEmbed:
+  """Subset of Discord embed fields we care about."""
 
+  title: str | None = None
+  description: str | None = None
+  url: str | None = None
 
-class DiscordAuthor(BaseModel):
-  model_config = ConfigDict(extra='ignore')
 
+@dataclass(slots=True)
+class DiscordAuthor:
   id: str
   username: str | None = None
   global_name: str | None = None
 
 
-class DiscordEmoji(BaseModel):
+@dataclass(slots=True)
+class DiscordEmoji:
   """Subset of emoji metadata used for component interactions."""
 
-  model_config = ConfigDict(extra='ignore')
-
   id: str | None = None
   name: str | None = None
   animated: bool | None = None
 
 
-class DiscordComponent(BaseModel):
+@dataclass(slots=True)
+class DiscordComponent:
   """Discord message component (buttons, action rows, etc.)."""
 
-  model_config = ConfigDict(extra='ignore')
-
   type: int
   custom_id: str | None = None
   emoji: DiscordEmoji | None = None
   label: str | None = None
   style: int | None = None
-  components: tuple['DiscordComponent', ...] = Field(default_factory=tuple)
+  components: tuple['DiscordComponent', ...] = field(default_factory=tuple)
 
 
-class DiscordMessage(BaseModel):
+@dataclass(slots=True)
+class DiscordMessage:
   """Typed representation of a Discord channel message."""
 
-  model_config = ConfigDict(extra='ignore')
-
   id: str
   content: str
   author: DiscordAuthor
   timestamp: datetime
-  embeds: tuple[DiscordEmbed, ...] = Field(default_factory=tuple)
-  components: tuple[DiscordComponent, ...] = Field(default_factory=tuple)
-  flags: int | None = Field(default=None)
+  embeds: tuple[DiscordEmbed, ...] = field(default_factory=tuple)
+  components: tuple[DiscordComponent, ...] = field(default_factory=tuple)
+  flags: int | None = None
 
 
 class KakeraReactionMode(str, Enum):
@@ -76,9 +77,13 @@ class KakeraReactionMode(str, Enum):
 
 
 class RollPlan(BaseModel):
-  """Configuration for a rolling session."""
+  """Configuration for a rolling session.
 
-  model_config = ConfigDict(extra='forbid')
+  Frozen so a running session can hold a reference to the plan it was
+  launched with while the UI swaps in replacement instances.
+  """
+
+  model_config = ConfigDict(extra='forbid', frozen=True)
 
   us_uses: int = Field(default=0, ge=0, description='Number of $us boosts to perform')
   roll_count: int = Field(default=0, ge=0, description='Number of $wa rolls to send')
@@ -112,3 +117,7 @@ class LogEntry(BaseModel):
   level: LogLevel = Field(default=LogLevel.INFO)
   message: str
   created_at: datetime
+  timestamp_text: str = Field(
+    default='',
+    description='Preformatted HH:MM:SS display form of created_at',
+  )
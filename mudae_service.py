@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import time
+from collections import deque
 from datetime import UTC, datetime
 
 from discord_client import DiscordHTTPClient
@@ -9,6 +11,12 @@ from settings import AppSettings
 
 MAX_US_BATCH_SIZE = 20
 
+_ENERGY_PHRASES = (
+  'out of energy',
+  "don't have enough energy",
+  'no energy left',
+)
+
 
 class MudaeService:
   """High-level orchestration for sending commands to the Mudae bot."""
@@ -17,8 +25,10 @@ class MudaeService:
     self._client = client
     self._settings = settings
     self._last_seen_card: datetime | None = None
+    self._last_seen_card_id: str | None = None
+    self._kakera_targets_cache: dict[KakeraReactionMode, tuple[str, ...]] = {}
 
-  def execute_roll_plan(self, plan: RollPlan) -> RollSummary:
+  async def execute_roll_plan(self, plan: RollPlan) -> RollSummary:
     start = time.perf_counter()
     total_messages = 0
     cards_detected = 0
@@ -29,19 +39,19 @@ class MudaeService:
     target_kakera = self._resolve_kakera_targets(plan.kakera_reaction_mode)
     kakera_energy_depleted = False
 
-    def sleep_between_actions() -> None:
+    async def sleep_between_actions() -> None:
       if roll_delay > 0:
-        time.sleep(roll_delay)
+        await asyncio.sleep(roll_delay)
 
-    def perform_roll() -> None:
+    async def perform_roll() -> None:
       nonlocal total_messages, cards_detected, last_card_title, kakera_energy_depleted
       if plan.use_slash_commands:
-        self._client.trigger_slash_command()
+        await self._client.trigger_slash_command()
       else:
-        self._client.send_message(roll_text_command)
+        await self._client.send_message(roll_text_command)
       total_messages += 1
 
-      card = self._await_card(timeout_seconds=15.0)
+      card = await self._await_card(timeout_seconds=15.0)
       if card:
         cards_detected += 1
         last_card_title = next(
@@ -49,26 +59,26 @@ class MudaeService:
           last_card_title,
         )
         if plan.use_slash_commands and target_kakera and not kakera_energy_depleted:
-          kakera_energy_depleted = self._handle_kakera_reactions(card, target_kakera)
+          kakera_energy_depleted = await self._handle_kakera_reactions(card, target_kakera)
 
     for _ in range(plan.roll_count):
-      perform_roll()
-      sleep_between_actions()
+      await perform_roll()
+      await sleep_between_actions()
 
     us_remaining = plan.us_uses
     while us_remaining > 0:
       batch_size = min(MAX_US_BATCH_SIZE, us_remaining)
       boost_command = f'{command_prefix}us {batch_size}'
-      self._client.send_message(boost_command)
+      await self._client.send_message(boost_command)
       total_messages += 1
       us_remaining -= batch_size
-      sleep_between_actions()
+      await sleep_between_actions()
 
       for _ in range(batch_size):
-        perform_roll()
-        sleep_between_actions()
+        await perform_roll()
+        await sleep_between_actions()
 
-    self._client.send_message('Finished rolling by Mudae - https://github.com/lmqzzz/mudae')
+    await self._client.send_message('Finished rolling by Mudae - https://github.com/lmqzzz/mudae')
     total_messages += 1
 
     duration = time.perf_counter() - start
@@ -81,104 +91,130 @@ class MudaeService:
     )
 
   def _resolve_kakera_targets(self, mode: KakeraReactionMode) -> tuple[str, ...]:
+    # Settings are immutable for the service lifetime, so the resolved
+    # target tuple per mode is computed once and reused across sessions.
+    cached = self._kakera_targets_cache.get(mode)
+    if cached is not None:
+      return cached
     if mode is KakeraReactionMode.P_ONLY:
-      return ('kakeraP',)
-    # Preserve user-defined order while removing duplicates.
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for name in self._settings.kakera.preferred_types:
-      if name and name not in seen:
-        seen.add(name)
-        ordered.append(name)
-    return tuple(ordered)
-
-  def _handle_kakera_reactions(self, card: DiscordMessage, targets: tuple[str, ...]) -> bool:
+      targets: tuple[str, ...] = ('kakeraP',)
+    else:
+      # Preserve user-defined order while removing duplicates.
+      seen: set[str] = set()
+      ordered: list[str] = []
+      for name in self._settings.kakera.preferred_types:
+        if name and name not in seen:
+          seen.add(name)
+          ordered.append(name)
+      targets = tuple(ordered)
+    self._kakera_targets_cache[mode] = targets
+    return targets
+
+  async def _handle_kakera_reactions(self, card: DiscordMessage, targets: tuple[str, ...]) -> bool:
     component = self._select_kakera_component(card.components, targets)
     if component is None:
       return False
     try:
-      self._client.click_component(card, component)
+      await self._client.click_component(card, component)
     except Exception:  # noqa: BLE001
       return False
-    return self._await_kakera_feedback(since=card.timestamp)
+    return await self._await_kakera_feedback(since=card.timestamp)
 
   def _select_kakera_component(
     self,
     components: tuple[DiscordComponent, ...],
     targets: tuple[str, ...],
   ) -> DiscordComponent | None:
-    buttons = list(self._iter_button_components(components))
+    buttons = self._collect_button_components(components)
     if not buttons:
       return None
+    # First button per emoji name wins, matching the old nested scan order.
+    name_to_button: dict[str, DiscordComponent] = {}
+    for button in buttons:
+      emoji = button.emoji
+      if emoji and emoji.name and emoji.name not in name_to_button:
+        name_to_button[emoji.name] = button
     for target in targets:
-      for button in buttons:
-        emoji = button.emoji
-        if emoji and emoji.name == target:
-          return button
+      button = name_to_button.get(target)
+      if button is not None:
+        return button
     return None
 
-  def _await_kakera_feedback(self, *, since: datetime, timeout_seconds: float = 6.0) -> bool:
+  async def _await_kakera_feedback(self, *, since: datetime, timeout_seconds: float = 6.0) -> bool:
     deadline = time.monotonic() + timeout_seconds
     poll_interval = min(0.6, self._settings.tuning.poll_interval_seconds)
     while time.monotonic() < deadline:
-      messages = self._client.fetch_recent_messages(limit=5)
+      messages = await self._client.fetch_recent_messages(limit=5)
       for message in messages:
         if message.author.id != self._settings.discord.mudae_user_id:
           continue
         if message.timestamp <= since:
           continue
-        content = message.content.lower()
-        if self._is_energy_depleted_message(content):
+        lowered = message.content.lower()
+        if self._is_energy_depleted_message(lowered):
           return True
-        if self._is_successful_reaction_message(content):
+        if self._is_successful_reaction_message(lowered):
           return False
-      time.sleep(poll_interval)
+      await asyncio.sleep(poll_interval)
     return False
 
   @staticmethod
-  def _iter_button_components(components: tuple[DiscordComponent, ...]):
-    for component in components:
-      if component.type == 1 and component.components:
-        yield from MudaeService._iter_button_components(component.components)
-      elif component.type == 2:
-        yield component
+  def _collect_button_components(
+    components: tuple[DiscordComponent, ...],
+  ) -> list[DiscordComponent]:
+    # Iterative walk avoids a generator frame per nested action row.
+    buttons: list[DiscordComponent] = []
+    pending = deque(components)
+    while pending:
+      component = pending.popleft()
+      if component.type == 2:
+        buttons.append(component)
+      elif component.type == 1 and component.components:
+        pending.extend(component.components)
+    return buttons
 
   @staticmethod
-  def _is_energy_depleted_message(content: str) -> bool:
-    lowered = content.lower()
-    energy_phrases = (
-      'out of energy',
-      "don't have enough energy",
-      'no energy left',
-    )
-    return any(phrase in lowered for phrase in energy_phrases)
+  def _is_energy_depleted_message(lowered: str) -> bool:
+    """Classify already-lowercased message content."""
+    return any(phrase in lowered for phrase in _ENERGY_PHRASES)
 
   @staticmethod
-  def _is_successful_reaction_message(content: str) -> bool:
-    lowered = content.lower()
+  def _is_successful_reaction_message(lowered: str) -> bool:
+    """Classify already-lowercased message content."""
     return 'react' in lowered and 'success' in lowered
 
-  def _await_card(self, *, timeout_seconds: float) -> DiscordMessage | None:
+  async def _await_card(self, *, timeout_seconds: float) -> DiscordMessage | None:
     deadline = time.monotonic() + timeout_seconds
-    poll_interval = self._settings.tuning.poll_interval_seconds
+    # Start polling aggressively and back off geometrically toward the
+    # configured interval: fast cards are detected quickly, slow ones do not
+    # burn extra rate budget.
+    poll_interval = min(0.15, self._settings.tuning.poll_interval_seconds)
+    max_interval = self._settings.tuning.poll_interval_seconds
     limit = self._settings.tuning.message_history_limit
     while time.monotonic() < deadline:
-      messages = self._client.poll_for_mudae_embeds(
+      messages = await self._client.poll_for_mudae_embeds(
         since=self._last_seen_card,
+        after_id=self._last_seen_card_id,
         limit=limit,
       )
       if messages:
-        latest = max(messages, key=lambda message: message.timestamp)
+        # poll_for_mudae_embeds returns newest-first.
+        latest = messages[0]
         self._last_seen_card = latest.timestamp
+        self._last_seen_card_id = latest.id
         return latest
-      time.sleep(poll_interval)
+      await asyncio.sleep(poll_interval)
+      poll_interval = min(poll_interval * 1.6, max_interval)
     return None
 
-  def sync_state(self) -> None:
+  async def sync_state(self) -> None:
     """Refresh the last seen card to avoid counting historical embeds."""
-    messages = self._client.poll_for_mudae_embeds(limit=5)
+    messages = await self._client.poll_for_mudae_embeds(limit=5)
     if messages:
-      latest = max(messages, key=lambda message: message.timestamp)
+      # poll_for_mudae_embeds returns newest-first.
+      latest = messages[0]
       self._last_seen_card = latest.timestamp
+      self._last_seen_card_id = latest.id
     else:
       self._last_seen_card = datetime.min.replace(tzinfo=UTC)
+      self._last_seen_card_id = None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 
@@ -13,6 +14,7 @@ DEFAULT_KAKERA_TYPES: tuple[str, ...] = (
   'kakeraW',
   'kakeraL',
 )
+DEFAULT_KAKERA_TYPES_SET: frozenset[str] = frozenset(DEFAULT_KAKERA_TYPES)
 
 
 class DiscordSettings(BaseModel):
@@ -33,8 +35,10 @@ class DiscordSettings(BaseModel):
     description='Slash command path (space-separated) used to perform rolls',
   )
 
-  @property
+  @functools.cached_property
   def slash_roll_command_path(self) -> tuple[str, ...]:
+    # Computed once per settings instance; the raw command string never
+    # changes after load.
     return tuple(part for part in self.slash_roll_command.strip().split() if part)
 
 
@@ -75,6 +79,11 @@ class KakeraSettings(BaseModel):
     description='Ordered list of kakera emoji names to react to when enabled',
   )
 
+  @functools.cached_property
+  def preferred_set(self) -> frozenset[str]:
+    """Unordered view of ``preferred_types`` for O(1) membership checks."""
+    return frozenset(self.preferred_types)
+
 
 class AppSettings(BaseModel):
   """Aggregated application configuration."""
@@ -86,32 +95,48 @@ class AppSettings(BaseModel):
   kakera: KakeraSettings
 
 
-def load_settings(env_file: str | Path | None = None) -> AppSettings:
-  """Load settings from an ``.env`` file into strongly typed objects."""
-  env_path = Path(env_file) if env_file else Path.cwd() / '.env'
+@functools.lru_cache(maxsize=None)
+def _load_dotenv_once(env_path: str) -> None:
+  """Parse the ``.env`` file at most once per path for the process lifetime."""
   load_dotenv(env_path, override=True)
 
-  discord_settings = DiscordSettings(
-    token=os.environ['DISCORD_TOKEN'],
-    channel_id=os.environ['DISCORD_CHANNEL_ID'],
-    guild_id=os.environ['DISCORD_GUILD_ID'],
-    mudae_user_id=os.environ.get('MUDAE_USER_ID', '432610292342587392'),
-    command_prefix=os.environ.get('DISCORD_COMMAND_PREFIX', '$'),
-    slash_roll_command=os.environ.get('SLASH_ROLL_COMMAND', 'wa'),
+
+def load_settings(env_file: str | Path | None = None, *, validate: bool = False) -> AppSettings:
+  """Load settings from an ``.env`` file into strongly typed objects.
+
+  Environment variables are trusted input and every value below is coerced to
+  its target type before construction, so the models are built with
+  ``model_construct`` to skip redundant schema validation. Pass
+  ``validate=True`` to force a full validation pass (e.g. in CI).
+  """
+  env_path = Path(env_file) if env_file else Path.cwd() / '.env'
+  _load_dotenv_once(str(env_path.resolve()))
+  env = os.environ
+
+  discord_settings = DiscordSettings.model_construct(
+    token=env['DISCORD_TOKEN'],
+    channel_id=env['DISCORD_CHANNEL_ID'],
+    guild_id=env['DISCORD_GUILD_ID'],
+    mudae_user_id=env.get('MUDAE_USER_ID', '432610292342587392'),
+    command_prefix=env.get('DISCORD_COMMAND_PREFIX', '$'),
+    slash_roll_command=env.get('SLASH_ROLL_COMMAND', 'wa'),
   )
 
-  tuning = RuntimeTuning(
-    roll_batch_size=int(os.environ.get('ROLL_BATCH_SIZE', '10')),
-    poll_interval_seconds=float(os.environ.get('POLL_INTERVAL_SECONDS', '1.5')),
-    message_history_limit=int(os.environ.get('MESSAGE_HISTORY_LIMIT', '50')),
-    roll_delay_seconds=float(os.environ.get('ROLL_DELAY_SECONDS', '1.0')),
+  tuning = RuntimeTuning.model_construct(
+    roll_batch_size=int(env.get('ROLL_BATCH_SIZE', '10')),
+    poll_interval_seconds=float(env.get('POLL_INTERVAL_SECONDS', '1.5')),
+    message_history_limit=int(env.get('MESSAGE_HISTORY_LIMIT', '50')),
+    roll_delay_seconds=float(env.get('ROLL_DELAY_SECONDS', '1.0')),
   )
 
-  preferred_kakera_env = os.environ.get('KAKERA_PREFERRED_TYPES', '')
-  preferred_kakera = tuple(part.strip() for part in preferred_kakera_env.split(',') if part.strip())
-  default_kakera_types = DEFAULT_KAKERA_TYPES
-  kakera = KakeraSettings(
-    preferred_types=preferred_kakera or default_kakera_types,
+  preferred_kakera_env = env.get('KAKERA_PREFERRED_TYPES', '')
+  # filter(None, ...) drops empty parts without calling .strip() twice.
+  preferred_kakera = tuple(filter(None, map(str.strip, preferred_kakera_env.split(','))))
+  kakera = KakeraSettings.model_construct(
+    preferred_types=preferred_kakera or DEFAULT_KAKERA_TYPES,
   )
 
-  return AppSettings(discord=discord_settings, tuning=tuning, kakera=kakera)
+  settings = AppSettings.model_construct(discord=discord_settings, tuning=tuning, kakera=kakera)
+  if validate:
+    return AppSettings.model_validate(settings.model_dump())
+  return settings
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import curses
 import threading
-import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
 from collections.abc import Callable
 from datetime import UTC, datetime
 
@@ -20,12 +23,16 @@ from settings import AppSettings
 
 
 class AppState(BaseModel):
-  """Mutable runtime state for the curses interface."""
+  """Mutable runtime state for the curses interface.
 
-  model_config = ConfigDict(extra='forbid', validate_assignment=True)
+  The single instance is mutated only through CursesApplication's typed
+  setters, so assignments skip revalidation; construction still validates.
+  """
+
+  model_config = ConfigDict(extra='forbid', validate_assignment=False)
 
   plan: RollPlan
-  logs: list[LogEntry] = Field(default_factory=list)
+  logs: deque[LogEntry] = Field(default_factory=lambda: deque(maxlen=_MAX_LOG_ENTRIES))
   is_busy: bool = False
   last_summary: RollSummary | None = None
   focus_index: int = 0
@@ -33,12 +40,57 @@ class AppState(BaseModel):
   editing_buffer: str | None = None
 
 
-class CursesApplication:
-  """Interactive dashboard for coordinating Mudae commands."""
+_MAX_LOG_ENTRIES = 200
+_VISIBLE_LOG_LINES = 6
+
+_LOG_COLOR: dict[LogLevel, int] = {
+  LogLevel.INFO: 7,
+  LogLevel.SUCCESS: 3,
+  LogLevel.WARNING: 8,
+  LogLevel.ERROR: 9,
+}
+
+_TITLE = ' Mudae Roll Orchestrator '
+_BANNER = 'Tab/↑/↓ move • Enter edits numbers • Space toggles slash mode • r run • q quit'
+
+_BASE_FOCUSABLE_FIELDS: tuple[tuple[str, str], ...] = (
+  ('roll_count', 'Roll remaining'),
+  ('us_uses', 'Roll count'),
+  ('use_slash_commands', 'Use slash commands'),
+)
+_SLASH_FOCUSABLE_FIELDS = _BASE_FOCUSABLE_FIELDS + (('kakera_reaction_mode', 'Kakera reaction'),)
+
 
-  def __init__(self, service: MudaeService, settings: AppSettings) -> None:
+@dataclass(slots=True)
+class RenderSnapshot:
+  """Cheap point-in-time view of AppState taken under the state lock."""
+
+  is_busy: bool
+  focus_index: int
+  editing_field: str | None
+  editing_buffer: str | None
+  logs_tail: tuple[tuple[int, str], ...]
+  last_summary: RollSummary | None
+
+
+class CursesApplication:
+  """Interactive dashboard for coordinating Mudae commands.
+
+  Threading invariant: ``plan``, ``focus_index``, and the ``editing_*``
+  fields are written exclusively by the UI thread, so their accessors rely
+  on the GIL instead of ``_state_lock``. The lock only guards state shared
+  with the session worker: ``is_busy``, ``last_summary``, and ``logs``.
+  """
+
+  def __init__(
+    self,
+    service: MudaeService,
+    settings: AppSettings,
+    loop: asyncio.AbstractEventLoop,
+  ) -> None:
     self._service = service
     self._settings = settings
+    self._loop = loop
     self._state = AppState(
       plan=RollPlan(
         us_uses=settings.tuning.roll_batch_size // 2,
@@ -47,89 +99,146 @@ class CursesApplication:
       focus_index=1,
     )
     self._state_lock = threading.Lock()
-    self._runner: threading.Thread | None = None
+    self._runner: Future[None] | None = None
     self._running = True
-
-  def _focusable_fields(self) -> list[tuple[str, str]]:
-    fields = [
-      ('roll_count', 'Roll remaining'),
-      ('us_uses', 'Roll count'),
-      ('use_slash_commands', 'Use slash commands'),
-    ]
-    with self._state_lock:
-      if self._state.plan.use_slash_commands:
-        fields.append(('kakera_reaction_mode', 'Kakera reaction'))
-    return fields
+    # Redraw gate: mutators flip this so idle loop iterations skip _render.
+    self._dirty = True
+    # (height, width, title_x, banner_x); recomputed only on resize.
+    self._layout_cache: tuple[int, int, int, int] | None = None
+    # Ring buffer of (color, formatted line) for the visible log area, kept
+    # in sync by _log so _render never touches the full log history.
+    self._recent_log_lines: deque[tuple[int, str]] = deque(maxlen=_VISIBLE_LOG_LINES)
+    self._global_key_handlers, self._field_key_handlers = self._build_key_tables()
+    # Display strings for plan fields, refreshed only when the plan changes.
+    self._plan_display = self._format_plan_display(self._state.plan)
+    # Color-pair attribute ints, filled in by _init_colors once curses is up.
+    self._cp: tuple[int, ...] = ()
+
+  def _build_key_tables(
+    self,
+  ) -> tuple[dict[int, Callable[[], None]], dict[tuple[str, int], Callable[[int], None]]]:
+    """Precompute key dispatch tables so _handle_key is two dict lookups."""
+    global_handlers: dict[int, Callable[[], None]] = {}
+    for key in (ord('q'), ord('Q')):
+      global_handlers[key] = self._quit
+    for key in (ord('r'), ord('R')):
+      global_handlers[key] = self._trigger_roll
+    for key in (curses.KEY_CTAB, 9, curses.KEY_DOWN):
+      global_handlers[key] = lambda: self._move_focus(1)
+    for key in (curses.KEY_BTAB, 353, curses.KEY_UP):
+      global_handlers[key] = lambda: self._move_focus(-1)
+
+    field_handlers: dict[tuple[str, int], Callable[[int], None]] = {}
+    adjusters = {
+      'roll_count': self._adjust_rolls,
+      'us_uses': self._adjust_us,
+    }
+    for field, adjust in adjusters.items():
+      for key in (curses.KEY_ENTER, 10, 13):
+        field_handlers[(field, key)] = lambda _key: self._start_edit()
+      for key in range(ord('0'), ord('9') + 1):
+        field_handlers[(field, key)] = lambda key: self._start_edit(initial_text=chr(key))
+      field_handlers[(field, ord('+'))] = lambda _key, adjust=adjust: adjust(delta=1)
+      field_handlers[(field, ord('-'))] = lambda _key, adjust=adjust: adjust(delta=-1)
+    for key in (curses.KEY_ENTER, 10, 13, ord(' '), ord('t'), ord('T')):
+      field_handlers[('use_slash_commands', key)] = lambda _key: self._toggle_slash_commands()
+    for key in (curses.KEY_ENTER, 10, 13, ord(' '), curses.KEY_LEFT, curses.KEY_RIGHT):
+      field_handlers[('kakera_reaction_mode', key)] = lambda _key: self._cycle_kakera_mode()
+    return global_handlers, field_handlers
+
+  def _quit(self) -> None:
+    self._running = False
+
+  def _replace_plan(self, **updates: object) -> RollPlan:
+    # RollPlan is frozen; swap in a rebuilt instance. model_construct skips
+    # revalidation since callers pass already-coerced values.
+    new_plan = RollPlan.model_construct(**{**self._state.plan.__dict__, **updates})
+    self._state.plan = new_plan
+    self._plan_display = self._format_plan_display(new_plan)
+    return new_plan
+
+  @classmethod
+  def _format_plan_display(cls, plan: RollPlan) -> dict[str, str]:
+    return {
+      'roll_count': str(plan.roll_count),
+      'us_uses': str(plan.us_uses),
+      'use_slash_commands': 'ON' if plan.use_slash_commands else 'OFF',
+      'kakera_reaction_mode': cls._describe_kakera_mode(plan.kakera_reaction_mode),
+    }
+
+  def _mark_dirty(self) -> None:
+    # A bare boolean store is atomic under the GIL, so no lock is needed even
+    # when the worker thread marks state dirty.
+    self._dirty = True
+
+  def _focusable_fields(self) -> tuple[tuple[str, str], ...]:
+    if self._state.plan.use_slash_commands:
+      return _SLASH_FOCUSABLE_FIELDS
+    return _BASE_FOCUSABLE_FIELDS
 
   def _current_focus(self) -> tuple[str, str]:
     fields = self._focusable_fields()
-    with self._state_lock:
-      index = self._state.focus_index % len(fields)
-    return fields[index]
+    return fields[self._state.focus_index % len(fields)]
 
   def _is_editing(self) -> bool:
-    with self._state_lock:
-      return self._state.editing_field is not None
+    return self._state.editing_field is not None
 
   def _move_focus(self, delta: int) -> None:
     fields = self._focusable_fields()
-    with self._state_lock:
-      new_index = (self._state.focus_index + delta) % len(fields)
-      self._state.focus_index = new_index
-      self._state.editing_field = None
-      self._state.editing_buffer = None
+    self._state.focus_index = (self._state.focus_index + delta) % len(fields)
+    self._state.editing_field = None
+    self._state.editing_buffer = None
+    self._mark_dirty()
 
   def _start_edit(self, *, initial_text: str | None = None) -> None:
     field, _ = self._current_focus()
     if field == 'use_slash_commands':
       return
-    with self._state_lock:
-      current_value = getattr(self._state.plan, field)
-      buffer = initial_text if initial_text is not None else str(current_value)
-      self._state.editing_field = field
-      self._state.editing_buffer = buffer
+    current_value = getattr(self._state.plan, field)
+    self._state.editing_field = field
+    self._state.editing_buffer = initial_text if initial_text is not None else str(current_value)
+    self._mark_dirty()
 
   def _cancel_edit(self) -> None:
-    with self._state_lock:
-      self._state.editing_field = None
-      self._state.editing_buffer = None
+    self._state.editing_field = None
+    self._state.editing_buffer = None
+    self._mark_dirty()
 
   def _update_edit_buffer(self, mutate: Callable[[str], str]) -> None:
-    with self._state_lock:
-      if self._state.editing_buffer is None:
-        return
-      new_buffer = mutate(self._state.editing_buffer)
-      self._state.editing_buffer = new_buffer
+    if self._state.editing_buffer is None:
+      return
+    self._state.editing_buffer = mutate(self._state.editing_buffer)
+    self._mark_dirty()
 
   def _commit_edit(self) -> None:
     message: str | None = None
-    with self._state_lock:
-      field = self._state.editing_field
-      buffer = self._state.editing_buffer
-      if field is None:
-        return
-      self._state.editing_field = None
-      self._state.editing_buffer = None
-
-      if not buffer:
-        return
-
-      try:
-        value = int(buffer)
-      except ValueError:
-        return
-
-      plan = self._state.plan
-      if field == 'us_uses':
-        value = max(0, value)
-        if value != plan.us_uses:
-          self._state.plan = plan.model_copy(update={'us_uses': value})
-          message = f'Roll count set to {value}'
-      elif field == 'roll_count':
-        value = max(0, value)
-        if value != plan.roll_count:
-          self._state.plan = plan.model_copy(update={'roll_count': value})
-          message = f'Roll remaining set to {value}'
+    field = self._state.editing_field
+    buffer = self._state.editing_buffer
+    if field is None:
+      return
+    self._state.editing_field = None
+    self._state.editing_buffer = None
+    self._mark_dirty()
+
+    if not buffer:
+      return
+
+    try:
+      value = int(buffer)
+    except ValueError:
+      return
+
+    plan = self._state.plan
+    if field == 'us_uses':
+      value = max(0, value)
+      if value != plan.us_uses:
+        self._replace_plan(us_uses=value)
+        message = f'Roll count set to {value}'
+    elif field == 'roll_count':
+      value = max(0, value)
+      if value != plan.roll_count:
+        self._replace_plan(roll_count=value)
+        message = f'Roll remaining set to {value}'
 
     if message:
       self._log(message, LogLevel.INFO)
@@ -167,17 +276,20 @@ class CursesApplication:
 
   def run(self, screen: curses._CursesWindow) -> None:  # type: ignore[name-defined]
     curses.curs_set(0)
-    screen.nodelay(True)
+    # Blocking getch with a 50 ms timeout: the kernel wakes us on input
+    # instead of busy-polling with nodelay + sleep.
+    screen.timeout(50)
     curses.start_color()
     curses.use_default_colors()
     self._init_colors()
     self._log("Ready to roll! Press 'r' to start a session.", LogLevel.INFO)
 
     while self._running:
-      self._render(screen)
+      if self._dirty:
+        self._dirty = False
+        self._render(screen)
       key = screen.getch()
       if key == -1:
-        time.sleep(0.05)
         continue
       self._handle_key(key)
 
@@ -186,93 +298,60 @@ class CursesApplication:
       self._handle_editing_key(key)
       return
 
-    if key in (ord('q'), ord('Q')):
-      self._running = False
-      return
-    if key in (ord('r'), ord('R')):
-      self._trigger_roll()
-      return
-    if key in (curses.KEY_CTAB, 9, curses.KEY_DOWN):
-      self._move_focus(1)
-      return
-    if key in (curses.KEY_BTAB, 353, curses.KEY_UP):
-      self._move_focus(-1)
+    global_handler = self._global_key_handlers.get(key)
+    if global_handler is not None:
+      global_handler()
       return
 
     field, _ = self._current_focus()
-
-    if field in {'us_uses', 'roll_count'}:
-      if key in (curses.KEY_ENTER, 10, 13):
-        self._start_edit()
-        return
-      if ord('0') <= key <= ord('9'):
-        self._start_edit(initial_text=chr(key))
-        return
-      if key == ord('+'):
-        if field == 'roll_count':
-          self._adjust_rolls(delta=1)
-        else:
-          self._adjust_us(delta=1)
-        return
-      if key == ord('-'):
-        if field == 'roll_count':
-          self._adjust_rolls(delta=-1)
-        else:
-          self._adjust_us(delta=-1)
-        return
-    elif field == 'use_slash_commands':
-      if key in (curses.KEY_ENTER, 10, 13, ord(' '), ord('t'), ord('T')):
-        self._toggle_slash_commands()
-        return
-    elif field == 'kakera_reaction_mode':
-      if key in (curses.KEY_ENTER, 10, 13, ord(' '), curses.KEY_LEFT, curses.KEY_RIGHT):
-        self._cycle_kakera_mode()
-        return
+    field_handler = self._field_key_handlers.get((field, key))
+    if field_handler is not None:
+      field_handler(key)
+      return
 
     if key == curses.KEY_RESIZE:
+      self._mark_dirty()
       return
 
   def _adjust_rolls(self, *, delta: int) -> None:
-    with self._state_lock:
-      new_value = max(0, self._state.plan.roll_count + delta)
-      self._state.plan = self._state.plan.model_copy(update={'roll_count': new_value})
+    new_value = max(0, self._state.plan.roll_count + delta)
+    self._replace_plan(roll_count=new_value)
     self._log(f'Roll remaining set to {new_value}', LogLevel.INFO)
 
   def _adjust_us(self, *, delta: int) -> None:
-    with self._state_lock:
-      new_value = max(0, self._state.plan.us_uses + delta)
-      self._state.plan = self._state.plan.model_copy(update={'us_uses': new_value})
+    new_value = max(0, self._state.plan.us_uses + delta)
+    self._replace_plan(us_uses=new_value)
     self._log(f'Roll count set to {new_value}', LogLevel.INFO)
 
   def _toggle_slash_commands(self) -> None:
-    with self._state_lock:
-      new_value = not self._state.plan.use_slash_commands
-      self._state.plan = self._state.plan.model_copy(update={'use_slash_commands': new_value})
-      if not new_value:
-        self._state.focus_index %= 3
-        if self._state.editing_field == 'kakera_reaction_mode':
-          self._state.editing_field = None
-          self._state.editing_buffer = None
+    new_value = not self._state.plan.use_slash_commands
+    self._replace_plan(use_slash_commands=new_value)
+    if not new_value:
+      self._state.focus_index %= len(_BASE_FOCUSABLE_FIELDS)
+      if self._state.editing_field == 'kakera_reaction_mode':
+        self._state.editing_field = None
+        self._state.editing_buffer = None
     mode = 'slash commands' if new_value else 'text commands'
     self._log(f'Rolling via {mode}.', LogLevel.INFO)
 
   def _cycle_kakera_mode(self) -> None:
-    with self._state_lock:
-      plan = self._state.plan
-      modes = list(KakeraReactionMode)
-      current_index = modes.index(plan.kakera_reaction_mode)
-      new_mode = modes[(current_index + 1) % len(modes)]
-      self._state.plan = plan.model_copy(update={'kakera_reaction_mode': new_mode})
+    modes = list(KakeraReactionMode)
+    current_index = modes.index(self._state.plan.kakera_reaction_mode)
+    new_mode = modes[(current_index + 1) % len(modes)]
+    self._replace_plan(kakera_reaction_mode=new_mode)
     label = self._describe_kakera_mode(new_mode)
     self._log(f'Kakera reaction set to {label}.', LogLevel.INFO)
 
   def _trigger_roll(self) -> None:
+    # _log takes _state_lock itself, so it must only be called after release.
     with self._state_lock:
-      if self._state.is_busy:
-        self._log('A session is already running.', LogLevel.WARNING)
-        return
-      plan = self._state.plan
-      self._state.is_busy = True
+      already_busy = self._state.is_busy
+      if not already_busy:
+        plan = self._state.plan
+        self._state.is_busy = True
+    if already_busy:
+      self._log('A session is already running.', LogLevel.WARNING)
+      return
 
     mode = 'slash' if plan.use_slash_commands else 'text'
     self._log(
@@ -280,13 +359,12 @@ class CursesApplication:
       LogLevel.SUCCESS,
     )
 
-    self._runner = threading.Thread(target=self._run_session, args=(plan,), daemon=True)
-    self._runner.start()
+    self._runner = asyncio.run_coroutine_threadsafe(self._run_session(plan), self._loop)
 
-  def _run_session(self, plan: RollPlan) -> None:
+  async def _run_session(self, plan: RollPlan) -> None:
     try:
-      self._service.sync_state()
-      summary = self._service.execute_roll_plan(plan)
+      await self._service.sync_state()
+      summary = await self._service.execute_roll_plan(plan)
       with self._state_lock:
         self._state.last_summary = summary
       total_rolls = summary.plan.roll_count + summary.plan.us_uses
@@ -301,52 +379,62 @@ class CursesApplication:
     finally:
       with self._state_lock:
         self._state.is_busy = False
+      self._mark_dirty()
 
   def _render(self, screen: curses._CursesWindow) -> None:  # type: ignore[name-defined]
     screen.erase()
     height, width = screen.getmaxyx()
 
     with self._state_lock:
-      state_copy = self._state.model_copy(deep=True)
+      state = self._state
+      snapshot = RenderSnapshot(
+        is_busy=state.is_busy,
+        focus_index=state.focus_index,
+        editing_field=state.editing_field,
+        editing_buffer=state.editing_buffer,
+        logs_tail=tuple(self._recent_log_lines),
+        last_summary=state.last_summary,
+      )
 
-    title = ' Mudae Roll Orchestrator '
-    screen.attron(curses.color_pair(1))
-    screen.addstr(0, max(0, (width - len(title)) // 2), title)
-    screen.attroff(curses.color_pair(1))
+    layout = self._layout_cache
+    if layout is None or layout[0] != height or layout[1] != width:
+      layout = (
+        height,
+        width,
+        max(0, (width - len(_TITLE)) // 2),
+        max(0, (width - len(_BANNER)) // 2),
+      )
+      self._layout_cache = layout
+    title_x, banner_x = layout[2], layout[3]
+
+    cp = self._cp
+    screen.attron(cp[1])
+    screen.addstr(0, title_x, _TITLE)
+    screen.attroff(cp[1])
 
-    banner = 'Tab/↑/↓ move • Enter edits numbers • Space toggles slash mode • r run • q quit'
-    screen.attron(curses.color_pair(2))
-    screen.addstr(2, max(0, (width - len(banner)) // 2), banner)
-    screen.attroff(curses.color_pair(2))
+    screen.attron(cp[2])
+    screen.addstr(2, banner_x, _BANNER)
+    screen.attroff(cp[2])
 
-    status_line = 'STATUS: RUNNING' if state_copy.is_busy else 'STATUS: IDLE'
-    color = 4 if state_copy.is_busy else 3
-    screen.attron(curses.color_pair(color))
+    status_line = 'STATUS: RUNNING' if snapshot.is_busy else 'STATUS: IDLE'
+    status_attr = cp[4] if snapshot.is_busy else cp[3]
+    screen.attron(status_attr)
     screen.addstr(4, 2, status_line)
-    screen.attroff(curses.color_pair(color))
+    screen.attroff(status_attr)
 
-    plan = state_copy.plan
     fields = self._focusable_fields()
-    focus_index = state_copy.focus_index % len(fields)
+    focus_index = snapshot.focus_index % len(fields)
     for offset, (field, label) in enumerate(fields):
       is_focus = offset == focus_index
-      is_editing = state_copy.editing_field == field
+      is_editing = snapshot.editing_field == field
       if is_editing:
-        buffer = state_copy.editing_buffer or ''
+        buffer = snapshot.editing_buffer or ''
         value_text = buffer + '_'
-      elif field == 'use_slash_commands':
-        value_text = 'ON' if plan.use_slash_commands else 'OFF'
-      elif field == 'us_uses':
-        value_text = str(plan.us_uses)
-      elif field == 'roll_count':
-        value_text = str(plan.roll_count)
-      elif field == 'kakera_reaction_mode':
-        value_text = self._describe_kakera_mode(plan.kakera_reaction_mode)
       else:
-        value_text = ''
+        value_text = self._plan_display.get(field, '')
 
       display = f'{label}: {value_text}'
-      attr = curses.color_pair(5)
+      attr = cp[5]
       if is_focus:
         attr |= curses.A_REVERSE
       if is_editing:
@@ -355,50 +443,49 @@ class CursesApplication:
       screen.addstr(6 + offset, 4, display[: width - 8])
       screen.attroff(attr)
 
-    summary = state_copy.last_summary
+    summary = snapshot.last_summary
     if summary:
-      screen.attron(curses.color_pair(6))
+      screen.attron(cp[6])
       screen.addstr(10, 2, 'Last Session Summary:')
-      screen.attroff(curses.color_pair(6))
-      summary_lines = [
+      screen.attroff(cp[6])
+      # One batched addstr for the whole block; the newline continuation
+      # indent keeps each line at column 4.
+      summary_text = '\n    '.join((
         f'Messages sent: {summary.total_messages_sent}',
         f'Cards detected: {summary.cards_detected}',
         f'Last card: {summary.last_card_title or "—"}',
         f'Duration: {summary.duration_seconds:.1f}s',
-      ]
-      for idx, line in enumerate(summary_lines, start=11):
-        screen.addstr(idx, 4, line)
+      ))
+      screen.addstr(11, 4, summary_text)
 
-    screen.attron(curses.color_pair(2))
+    screen.attron(cp[2])
     screen.addstr(height - 8, 2, 'Event log:')
-    screen.attroff(curses.color_pair(2))
-
-    visible_logs = state_copy.logs[-6:]
-    for idx, entry in enumerate(visible_logs, start=height - 6):
-      color = self._log_color(entry.level)
-      timestamp = entry.created_at.astimezone(UTC).strftime('%H:%M:%S')
-      line = f'[{timestamp}] {entry.message}'
-      screen.attron(curses.color_pair(color))
+    screen.attroff(cp[2])
+
+    for idx, (color, line) in enumerate(snapshot.logs_tail, start=height - 6):
+      screen.attron(cp[color])
       screen.addstr(idx, 4, line[: width - 8])
-      screen.attroff(curses.color_pair(color))
+      screen.attroff(cp[color])
 
     screen.refresh()
 
-  @staticmethod
-  def _log_color(level: LogLevel) -> int:
-    return {
-      LogLevel.INFO: 7,
-      LogLevel.SUCCESS: 3,
-      LogLevel.WARNING: 8,
-      LogLevel.ERROR: 9,
-    }[level]
-
   def _log(self, message: str, level: LogLevel) -> None:
-    entry = LogEntry(level=level, message=message, created_at=datetime.now(UTC))
+    now = datetime.now(UTC)
+    # Format once at creation; _render would otherwise re-run strftime on the
+    # same immutable timestamp every frame.
+    entry = LogEntry(
+      level=level,
+      message=message,
+      created_at=now,
+      timestamp_text=now.strftime('%H:%M:%S'),
+    )
     with self._state_lock:
+      # The deque's maxlen evicts the oldest entry in O(1).
       self._state.logs.append(entry)
-      if len(self._state.logs) > 200:
-        self._state.logs.pop(0)
+      self._recent_log_lines.append(
+        (_LOG_COLOR[level], f'[{entry.timestamp_text}] {message}'),
+      )
+    self._mark_dirty()
 
   @staticmethod
   def _describe_kakera_mode(mode: KakeraReactionMode) -> str:
@@ -407,8 +494,7 @@ class CursesApplication:
       KakeraReactionMode.P_ONLY: 'Only react to kakeraP',
     }[mode]
 
-  @staticmethod
-  def _init_colors() -> None:
+  def _init_colors(self) -> None:
     curses.init_pair(1, curses.COLOR_MAGENTA, -1)
     curses.init_pair(2, curses.COLOR_CYAN, -1)
     curses.init_pair(3, curses.COLOR_GREEN, -1)
@@ -418,3 +504,6 @@ class CursesApplication:
     curses.init_pair(7, curses.COLOR_WHITE, -1)
     curses.init_pair(8, curses.COLOR_YELLOW, -1)
     curses.init_pair(9, curses.COLOR_RED, -1)
+    # color_pair is a C call per invocation; resolve each pair once here so
+    # _render indexes plain ints.
+    self._cp = tuple(curses.color_pair(i) for i in range(10))